@@ -31,16 +31,31 @@ IMPORTANT NOTES:
 
 from __future__ import annotations
 
+import codecs
+import math
 import os
 import warnings
-from typing import Tuple
 
+import charset_normalizer  # if necessary: pip install charset-normalizer
 import numpy as np
 import pandas as pd
+import pyarrow as pa  # if necessary: pip install pyarrow
+from pyarrow import csv as pacsv
 from pyproj import Transformer
+from scipy.spatial import cKDTree
 
 from pathlib import Path
 
+try:
+    from numba import njit, prange  # optional speed-up; if necessary: pip install numba
+except ImportError:
+    njit = None
+
+try:
+    import simsimd  # optional SIMD distance kernels; if necessary: pip install simsimd
+except ImportError:
+    simsimd = None
+
 # =========================
 # PATHS
 # =========================
@@ -59,15 +74,39 @@ OUT_DIR = DERIVED_DIR
 WINDOW_START = "2007-06-01"
 WINDOW_END = "2011-08-31"
 
+# Nearest sites fetched per region from the all-sites KD-tree before filtering to the day's active ones
+KNN_CANDIDATES = 8
 
-def read_csv_smart(path: str, dtype=None) -> pd.DataFrame:
-    """Read CSV using common encodings."""
+
+def detect_encoding(path, n_bytes: int = 65536) -> str:
+    """Detect a CSV's encoding from its first n_bytes (-1: whole file), preferring the encodings KMA/SGIS files use."""
+    with open(path, "rb") as f:
+        head = f.read(n_bytes)
     for enc in ("utf-8-sig", "utf-8", "cp949", "euc-kr"):
         try:
-            return pd.read_csv(path, encoding=enc, dtype=dtype)
+            # final=False: a multibyte character cut at the n_bytes boundary is not an error
+            codecs.getincrementaldecoder(enc)().decode(head, final=False)
+            return enc
         except UnicodeDecodeError:
             continue
-    return pd.read_csv(path, dtype=dtype)
+    best = charset_normalizer.from_bytes(head).best()
+    return best.encoding if best is not None else "utf-8"
+
+
+def read_csv_smart(path: str, dtype=None) -> pd.DataFrame:
+    """Read CSV with the detected encoding and the pyarrow parser (dtype is applied after pyarrow's type inference)."""
+    try:
+        return pd.read_csv(path, encoding=detect_encoding(path), dtype=dtype, engine="pyarrow")
+    except UnicodeDecodeError:
+        # The head decoded cleanly but a later byte did not (e.g. ASCII rows first): detect on the whole file
+        return pd.read_csv(path, encoding=detect_encoding(path, n_bytes=-1), dtype=dtype, engine="pyarrow")
+
+
+def write_csv(tbl: pa.Table, path) -> None:
+    """Write CSV with Arrow's C++ writer, keeping the UTF-8 BOM of encoding="utf-8-sig"."""
+    with open(path, "wb") as f:
+        f.write(codecs.BOM_UTF8)
+        pacsv.write_csv(tbl, f)
 
 
 def prepare_meta(meta: pd.DataFrame, window_start: pd.Timestamp, window_end: pd.Timestamp) -> pd.DataFrame:
@@ -105,66 +144,152 @@ def prepare_meta(meta: pd.DataFrame, window_start: pd.Timestamp, window_end: pd.
 
 
 def attach_segment_to_sun(sun: pd.DataFrame, meta: pd.DataFrame) -> pd.DataFrame:
-    """Attach correct (lon,lat) for each station-day from META segments."""
-    m = sun.merge(
-        meta[["지점", "지점명", "seg_start", "seg_end", "위도", "경도"]],
-        on="지점",
-        how="left",
-        suffixes=("", "_meta")
-    )
-
-    in_seg = (m["일시"] >= m["seg_start"]) & (m["일시"] <= m["seg_end"])
-    m = m.loc[in_seg].copy()
+    """Attach correct (lon,lat) and UTM-K (x,y) for each station-day from META segments."""
+    # After prepare_meta, segments within a station do not overlap (some may be empty: end < start),
+    # so each station's segments form a non-overlapping IntervalIndex that maps a day to at most one segment.
+    seg_cols = ["지점", "지점명", "seg_start", "seg_end", "위도", "경도", "st_x_utmK", "st_y_utmK"]
+    seg = meta.loc[meta["seg_end"] >= meta["seg_start"], seg_cols]
+    seg = seg.reset_index(drop=True)
+    meta_by_station = {
+        st: (pd.IntervalIndex.from_arrays(g["seg_start"], g["seg_end"], closed="both"), g.index.to_numpy())
+        for st, g in seg.groupby("지점")
+    }
+
+    sun = sun.sort_values(["지점", "일시"], kind="stable").drop_duplicates(subset=["지점", "일시"], keep="first")
+    sun = sun.reset_index(drop=True)
+    days = sun["일시"].to_numpy()
+
+    seg_pos = np.full(len(sun), -1, dtype=np.intp)
+    for st, rows in sun.groupby("지점").indices.items():
+        if st not in meta_by_station:
+            continue
+        iv, seg_rows = meta_by_station[st]
+        pos = iv.get_indexer(days[rows])
+        hit = pos >= 0
+        seg_pos[rows[hit]] = seg_rows[pos[hit]]
 
-    # If multiple segments match, keep the latest seg_start
-    m = m.sort_values(["지점", "일시", "seg_start"], ascending=[True, True, False])
-    m = m.drop_duplicates(subset=["지점", "일시"], keep="first")
+    m = sun.loc[seg_pos >= 0].copy()
+    seg_pos = seg_pos[seg_pos >= 0]
+    m["지점명_meta"] = seg["지점명"].to_numpy()[seg_pos]
+    for col in seg_cols[2:]:
+        m[col] = seg[col].to_numpy()[seg_pos]
 
     return m
 
 
-def nearest_station_for_day(
-    rx: np.ndarray, ry: np.ndarray, stx: np.ndarray, sty: np.ndarray
-) -> Tuple[np.ndarray, np.ndarray]:
-    """Return (idx, dist_m) for each region among candidate stations."""
-    dx = rx[:, None] - stx[None, :]
-    dy = ry[:, None] - sty[None, :]
-    dist = np.hypot(dx, dy)
-    idx = dist.argmin(axis=1)
-    dist_m = dist[np.arange(dist.shape[0]), idx]
-    return idx, dist_m
-
-
-def make_intervals(region_day: pd.DataFrame, station_col: str, dist_col: str) -> pd.DataFrame:
+if njit is not None:
+    # fastmath without ninf: inf seeds the running minimum
+    @njit(parallel=True, fastmath={"nnan", "nsz", "arcp", "contract", "afn", "reassoc"}, cache=True)
+    def _nearest_site_kernel(pts, site_xy, active, out_idx, out_dist):
+        """Fill out_idx/out_dist (U, R) with the nearest active site; no (R, S) temporaries."""
+        n_regions = pts.shape[0]
+        n_sites = site_xy.shape[0]
+        for u in prange(active.shape[0]):
+            for r in range(n_regions):
+                best = np.float32(np.inf)
+                best_s = -1
+                for s in range(n_sites):
+                    if not active[u, s]:
+                        continue
+                    dx = pts[r, 0] - site_xy[s, 0]
+                    dy = pts[r, 1] - site_xy[s, 1]
+                    d2 = dx * dx + dy * dy
+                    if d2 < best:
+                        best = d2
+                        best_s = s
+                out_idx[u, r] = best_s
+                out_dist[u, r] = math.sqrt(best)
+
+
+def nearest_active_site(
+    pts: np.ndarray,
+    site_xy: np.ndarray,
+    active: np.ndarray,
+    out_idx: np.ndarray,
+    out_dist: np.ndarray,
+    k: int = KNN_CANDIDATES,
+) -> None:
+    """Fill out_idx/out_dist (U, R) with the nearest active site per configuration and region.
+
+    pts: (R, 2) region [x, y]; site_xy: (S, 2) station sites; active: (U, S) mask per configuration.
+    """
+    n_regions = pts.shape[0]
+    r_i = np.arange(n_regions)[None, :]
+
+    # simsimd: all region-site squared distances in one SIMD cdist call; each region takes its closest active site
+    if simsimd is not None:
+        d2 = np.asarray(simsimd.cdist(pts, site_xy, metric="sqeuclidean"))  # (R, S)
+        order = np.argsort(d2, axis=1, kind="stable")  # sites by distance, per region
+        first = active[:, order].argmax(axis=2)  # (U, R) rank of the closest active site
+        out_idx[:] = order[r_i, first]
+        out_dist[:] = np.sqrt(d2[r_i, out_idx])
+        return
+
+    # numba: brute-force kernel, parallel over configurations
+    if njit is not None:
+        _nearest_site_kernel(pts, site_xy, active, out_idx, out_dist)
+        return
+
+    # Fallback: one KD-tree over all sites gives each region's k nearest; the first active one is taken
+    k = min(k, site_xy.shape[0])
+    cand_dist, cand_idx = cKDTree(site_xy).query(pts, k=k, workers=-1)  # nearest first
+    cand_dist = cand_dist.reshape(n_regions, k)
+    cand_idx = cand_idx.reshape(n_regions, k)
+
+    cand_active = active[:, cand_idx]  # (U, R, k)
+    first = cand_active.argmax(axis=2)
+    out_idx[:] = cand_idx[r_i, first]
+    out_dist[:] = cand_dist[r_i, first]
+
+    # widen: search all sites where none of the k nearest were active
+    uu, rr = np.nonzero(~cand_active.any(axis=2))
+    if uu.size:
+        # squared distance preserves the argmin; sqrt only the chosen one
+        dx = pts[rr, 0, None] - site_xy[None, :, 0]
+        dy = pts[rr, 1, None] - site_xy[None, :, 1]
+        d2 = dx * dx + dy * dy
+        d2[~active[uu]] = np.inf
+        best = d2.argmin(axis=1)
+        out_idx[uu, rr] = best
+        out_dist[uu, rr] = np.sqrt(d2[np.arange(uu.size), best])
+
+
+def make_intervals(region_day: pa.Table, station_col: str, dist_col: str) -> pa.Table:
     """Compress region-day station assignments into intervals."""
-    out = []
-    gcols = ["SIGUNGU_CD", "resid_area", "date", station_col, dist_col]
-    for area, g in region_day[gcols].sort_values(["resid_area", "date"]).groupby("resid_area"):
-        st = g[station_col].to_numpy()
-        d = g[dist_col].to_numpy()
-        dates = pd.to_datetime(g["date"]).to_numpy()
-        code = g["SIGUNGU_CD"].iloc[0]
-
-        change = np.ones(len(g), dtype=bool)
-        change[1:] = (st[1:] != st[:-1])
-
-        starts = np.where(change)[0]
-        ends = np.r_[starts[1:] - 1, len(g) - 1]
-
-        for s, e in zip(starts, ends):
-            st_id = st[s]
-            if pd.isna(st_id):
-                continue
-            out.append({
-                "SIGUNGU_CD": code,
-                "resid_area": area,
-                "station_id": int(st_id),
-                "start_date": pd.to_datetime(dates[s]).date().isoformat(),
-                "end_date": pd.to_datetime(dates[e]).date().isoformat(),
-                "mean_distance_m": float(np.nanmean(d[s:e+1])),
-                "n_days": int(e - s + 1),
-            })
-    return pd.DataFrame(out)
+    area = region_day["resid_area"].combine_chunks().indices.to_numpy()
+    dates = region_day["date"].to_numpy()
+    order = np.lexsort((dates, area))
+    area = area[order]
+    st = region_day[station_col].to_numpy()[order]
+    d = region_day[dist_col].to_numpy().astype(np.float64)[order]
+
+    # a run starts at every region boundary and at every station change within a region
+    change = np.ones(order.size, dtype=bool)
+    change[1:] = (area[1:] != area[:-1]) | (st[1:] != st[:-1])
+
+    starts = np.flatnonzero(change)
+    ends = np.r_[starts[1:] - 1, order.size - 1]
+
+    # nan-aware mean distance per run
+    valid = ~np.isnan(d)
+    d_sum = np.add.reduceat(np.where(valid, d, 0.0), starts)
+    d_cnt = np.add.reduceat(valid.astype(np.int64), starts)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean_d = d_sum / d_cnt
+
+    keep = ~pd.isna(st[starts])
+    starts, ends, mean_d = starts[keep], ends[keep], mean_d[keep]
+
+    keys = region_day.select(["SIGUNGU_CD", "resid_area"]).take(order[starts])
+    return pa.table({
+        "SIGUNGU_CD": keys["SIGUNGU_CD"],
+        "resid_area": keys["resid_area"],
+        "station_id": pa.array(st[starts].astype(np.int64)),
+        "start_date": pa.array(dates[order[starts]]),
+        "end_date": pa.array(dates[order[ends]]),
+        "mean_distance_m": pa.array(mean_d, from_pandas=True),
+        "n_days": pa.array(ends - starts + 1),
+    })
 
 
 def main() -> None:
@@ -188,10 +313,10 @@ def main() -> None:
     centers["SIGUNGU_CD"] = centers["SIGUNGU_CD"].astype(str).str.zfill(5)
     centers["resid_area"] = centers["resid_area"].astype(str).str.replace(r"\s+", "", regex=True)
 
-    rx_c = centers["centroid_x_utmK"].astype(float).to_numpy()
-    ry_c = centers["centroid_y_utmK"].astype(float).to_numpy()
-    rx_r = centers["rep_x_utmK"].astype(float).to_numpy()
-    ry_r = centers["rep_y_utmK"].astype(float).to_numpy()
+    # float32 is ~0.1 m resolution at UTM-K magnitudes, far below the km-scale station distances
+    # Contiguous (R, 2) [x, y] blocks, built once and passed as-is to the distance kernels
+    pts_c = np.ascontiguousarray(centers[["centroid_x_utmK", "centroid_y_utmK"]].to_numpy(), dtype=np.float32)
+    pts_r = np.ascontiguousarray(centers[["rep_x_utmK", "rep_y_utmK"]].to_numpy(), dtype=np.float32)
 
     # ----------------------
     # Load sunshine data
@@ -219,6 +344,13 @@ def main() -> None:
     meta = read_csv_smart(STATION_META_PATH)
     meta = prepare_meta(meta, sun["일시"].min().normalize(), sun["일시"].max().normalize())
 
+    # Convert station lon/lat -> UTM-K (EPSG:5179) for meter distances, once per META segment
+    # (far fewer points than station-days)
+    to_utmK = Transformer.from_crs(4326, 5179, always_xy=True)
+    stx, sty = to_utmK.transform(meta["경도"].to_numpy(dtype=np.float64), meta["위도"].to_numpy(dtype=np.float64))
+    meta["st_x_utmK"] = stx.astype(np.float32)
+    meta["st_y_utmK"] = sty.astype(np.float32)
+
     # ----------------------
     # Attach correct station coords (segment-valid) to each station-day sunshine record
     # ----------------------
@@ -227,54 +359,82 @@ def main() -> None:
         meta
     )
 
-    # Convert station lon/lat -> UTM-K (EPSG:5179) for meter distances
-    to_utmK = Transformer.from_crs(4326, 5179, always_xy=True)
-    stx, sty = to_utmK.transform(sun_seg["경도"].to_numpy(), sun_seg["위도"].to_numpy())
-    sun_seg["st_x_utmK"] = stx
-    sun_seg["st_y_utmK"] = sty
-
     # ----------------------
     # Compute nearest station per region per day
     # ----------------------
-    out_rows = []
-    for day, g in sun_seg.groupby(sun_seg["일시"].dt.normalize()):
-        st_ids = g["지점"].to_numpy()
-        stx = g["st_x_utmK"].to_numpy()
-        sty = g["st_y_utmK"].to_numpy()
-        sun_hr = g[sun_col].to_numpy()
-
-        # nearest for centroid / representative point
-        idx_c, dist_c = nearest_station_for_day(rx_c, ry_c, stx, sty)
-        idx_r, dist_r = nearest_station_for_day(rx_r, ry_r, stx, sty)
-
-        out_rows.append(pd.DataFrame({
-            "SIGUNGU_CD": centers["SIGUNGU_CD"].to_numpy(),
-            "resid_area": centers["resid_area"].to_numpy(),
-            "date": pd.to_datetime(day).date().isoformat(),
-
-            "station_id_centroid": st_ids[idx_c],
-            "dist_m_centroid": dist_c,
-            "sun_hr_centroid": sun_hr[idx_c],
-
-            "station_id_rep": st_ids[idx_r],
-            "dist_m_rep": dist_r,
-            "sun_hr_rep": sun_hr[idx_r],
-        }))
-
-    region_day = pd.concat(out_rows, ignore_index=True)
+    # Station sites: one per (station, META segment), each with fixed UTM-K coordinates.
+    # A day's candidate set is then a boolean mask over sites, (D, S); sunshine is a (D, S) panel.
+    day_i64 = sun_seg["일시"].to_numpy().astype("datetime64[D]").astype(np.int64)
+    days, day_code = np.unique(day_i64, return_inverse=True)
+    site_code = sun_seg.groupby(["지점", "seg_start"], sort=True).ngroup().to_numpy()
+    _, site_first = np.unique(site_code, return_index=True)
+    site_ids = sun_seg["지점"].to_numpy(dtype=np.int32)[site_first]
+    site_xy = np.ascontiguousarray(sun_seg[["st_x_utmK", "st_y_utmK"]].to_numpy(dtype=np.float32)[site_first])
+
+    active = np.zeros((days.size, site_ids.size), dtype=bool)
+    sunhr_ds = np.full((days.size, site_ids.size), np.nan)
+    active[day_code, site_code] = True
+    sunhr_ds[day_code, site_code] = sun_seg[sun_col].to_numpy(dtype=np.float64)
+
+    # The active set changes only a few times in the window, so the search runs once per
+    # distinct day configuration and is broadcast back to the days.
+    cfg = np.ascontiguousarray(np.packbits(active, axis=1))
+    cfg_key = cfg.view(np.dtype((np.void, cfg.shape[1]))).ravel()
+    _, cfg_first, cfg_code = np.unique(cfg_key, return_index=True, return_inverse=True)
+    active_u = active[cfg_first]
+
+    # Output columns are allocated once as flat day-major (D*R,) arrays and filled in place
+    n_regions = len(centers)
+    n_rows = days.size * n_regions
+    panel_row = np.repeat(np.arange(days.size) * site_ids.size, n_regions)  # offset of each output day in sunhr_ds
+    idx_u = np.empty((cfg_first.size, n_regions), dtype=np.intp)
+    dist_u = np.empty((cfg_first.size, n_regions), dtype=np.float32)
+    idx = np.empty((days.size, n_regions), dtype=np.intp)
+
+    # Region keys repeat every day: dictionary-encode them (sorted values, so codes sort like names)
+    sgg_names, sgg_code = np.unique(centers["SIGUNGU_CD"].to_numpy(dtype=str), return_inverse=True)
+    area_names, area_code = np.unique(centers["resid_area"].to_numpy(dtype=str), return_inverse=True)
+    columns = {
+        "SIGUNGU_CD": pa.DictionaryArray.from_arrays(np.tile(sgg_code.astype(np.int32), days.size), sgg_names),
+        "resid_area": pa.DictionaryArray.from_arrays(np.tile(area_code.astype(np.int32), days.size), area_names),
+        "date": pa.array(np.repeat(days.astype("datetime64[D]"), n_regions)),  # date32; written as YYYY-MM-DD
+    }
+
+    # nearest for centroid / representative point
+    for method, pts in (("centroid", pts_c), ("rep", pts_r)):
+        station_id = np.empty(n_rows, dtype=site_ids.dtype)
+        dist_m = np.empty(n_rows, dtype=np.float32)
+        sun_hr = np.empty(n_rows, dtype=np.float64)
+
+        nearest_active_site(pts, site_xy, active_u, idx_u, dist_u)
+        np.take(idx_u, cfg_code, axis=0, out=idx)
+        np.take(dist_u, cfg_code, axis=0, out=dist_m.reshape(days.size, n_regions))
+        np.take(site_ids, idx.ravel(), out=station_id)
+        np.take(sunhr_ds.ravel(), panel_row + idx.ravel(), out=sun_hr)
+
+        columns[f"station_id_{method}"] = station_id
+        columns[f"dist_m_{method}"] = dist_m
+        columns[f"sun_hr_{method}"] = pa.array(sun_hr, from_pandas=True)  # missing sunshine -> null
+
+    # One Arrow table feeds every output; pandas is only used for the Stata export
+    region_day = pa.table(columns)
 
     # ----------------------
     # Save daily CSV (UTF-8)
     # ----------------------
     daily_csv = OUT_DIR / "sigungu_daily_sunlight_20070601_20110831.csv"
-    region_day.to_csv(daily_csv, index=False, encoding="utf-8-sig")
+    write_csv(region_day, daily_csv)
     print("Wrote:", daily_csv)
 
     # Daily DTA without Korean strings (safe for pandas -> Stata)
     daily_dta = OUT_DIR / "sigungu_daily_sunlight_20070601_20110831.dta"
     try:
-        region_day_noK = region_day.drop(columns=["resid_area"])
-        region_day_noK.to_stata(daily_dta, write_index=False, version=118)
+        # plain strings: to_stata would otherwise write a categorical SIGUNGU_CD as value-labelled codes;
+        # date stays "YYYY-MM-DD", which Merging_PSKC_and_Weather.do converts with daily()
+        region_day_noK = region_day.drop_columns(["resid_area"])
+        region_day_noK = region_day_noK.set_column(0, "SIGUNGU_CD", region_day_noK["SIGUNGU_CD"].cast(pa.string()))
+        region_day_noK = region_day_noK.set_column(1, "date", region_day_noK["date"].cast(pa.string()))
+        region_day_noK.to_pandas().to_stata(daily_dta, write_index=False, version=118)
         print("Wrote:", daily_dta)
     except Exception as e:
         warnings.warn(f"DTA export failed ({e!r}). Use the CSV and import in Stata instead.")
@@ -283,29 +443,36 @@ def main() -> None:
     # Intervals (compressed mapping)
     # ----------------------
     intervals_c = make_intervals(region_day, "station_id_centroid", "dist_m_centroid")
-    intervals_c["method"] = "centroid"
+    intervals_c = intervals_c.append_column("method", pa.array(["centroid"] * intervals_c.num_rows))
     intervals_r = make_intervals(region_day, "station_id_rep", "dist_m_rep")
-    intervals_r["method"] = "rep"
-    intervals = pd.concat([intervals_c, intervals_r], ignore_index=True)
+    intervals_r = intervals_r.append_column("method", pa.array(["rep"] * intervals_r.num_rows))
+    intervals = pa.concat_tables([intervals_c, intervals_r])
 
     intervals_csv = OUT_DIR / "sigungu_station_assignment_intervals_20070601_20110831.csv"
-    intervals.to_csv(intervals_csv, index=False, encoding="utf-8-sig")
+    write_csv(intervals, intervals_csv)
     print("Wrote:", intervals_csv)
 
     # ----------------------
     # Monthly sums (region-month)
     # ----------------------
-    region_day["ym"] = pd.to_datetime(region_day["date"]).dt.to_period("M").astype(str)
-    monthly = (region_day
-               .groupby(["SIGUNGU_CD", "resid_area", "ym"], as_index=False)
-               .agg(
-                   sun_hr_centroid_sum=("sun_hr_centroid", "sum"),
-                   sun_hr_rep_sum=("sun_hr_rep", "sum"),
-                   n_days=("date", "count")
-               ))
+    # Sort once by (region, month) and sum each contiguous block; SIGUNGU_CD and resid_area are 1-to-1
+    ym = region_day["date"].to_numpy().astype("datetime64[M]")
+    sgg = region_day["SIGUNGU_CD"].combine_chunks().indices.to_numpy()
+    order = np.lexsort((ym, sgg))
+    ym, sgg = ym[order], sgg[order]
+
+    starts = np.r_[0, np.flatnonzero((sgg[1:] != sgg[:-1]) | (ym[1:] != ym[:-1])) + 1]
+
+    monthly = region_day.select(["SIGUNGU_CD", "resid_area"]).take(order[starts])
+    monthly = monthly.append_column("ym", pa.array(np.datetime_as_string(ym[starts], unit="M")))
+    for col in ["sun_hr_centroid", "sun_hr_rep"]:
+        v = region_day[col].to_numpy()[order]
+        v = np.where(np.isnan(v), 0.0, v)  # missing sunshine adds nothing to the sum
+        monthly = monthly.append_column(f"{col}_sum", pa.array(np.add.reduceat(v, starts)))
+    monthly = monthly.append_column("n_days", pa.array(np.diff(np.r_[starts, order.size])))
 
     monthly_csv = OUT_DIR / "sigungu_monthly_sunlight_200706_201108.csv"
-    monthly.to_csv(monthly_csv, index=False, encoding="utf-8-sig")
+    write_csv(monthly, monthly_csv)
     print("Wrote:", monthly_csv)
 
 
@@ -9,6 +9,7 @@ import re
 import zipfile
 
 import shapefile  # if necessary: pip install pyshp
+import numpy as np
 import pandas as pd
 from shapely.geometry import shape as shapely_shape  # if necessary: pip install shapely
 from pyproj import Transformer  # if necessary: pip install pyproj
@@ -70,7 +71,9 @@ to_wgs84 = Transformer.from_crs(5179, 4326, always_xy=True)
 # ==========================================
 # 4) Compute centroid & representative point
 # ==========================================
-rows = []
+# Collect per-region values into parallel columns; the WGS84 conversion is done in one batched call below
+base_years, codes, names = [], [], []
+cent_x, cent_y, rp_x, rp_y = [], [], [], []
 for sr in r.iterShapeRecords():
     base_year, code, name = sr.record  # BASE_YEAR, SIGUNGU_CD, SIGUNGU_NM
     geom = shapely_shape(sr.shape.__geo_interface__)
@@ -78,28 +81,39 @@ for sr in r.iterShapeRecords():
     cent = geom.centroid                # geometric centroid (may be outside for concave shapes)
     rp = geom.representative_point()    # guaranteed inside polygon
 
-    lon_cent, lat_cent = to_wgs84.transform(cent.x, cent.y)
-    lon_rp, lat_rp = to_wgs84.transform(rp.x, rp.y)
+    base_years.append(int(base_year))
+    codes.append(str(code))
+    names.append(str(name))
+    cent_x.append(cent.x)
+    cent_y.append(cent.y)
+    rp_x.append(rp.x)
+    rp_y.append(rp.y)
 
-    rows.append({
-        "BASE_YEAR": int(base_year),
-        "SIGUNGU_CD": str(code),
-        "SIGUNGU_NM": str(name),
+cent_x, cent_y = np.asarray(cent_x, dtype=np.float64), np.asarray(cent_y, dtype=np.float64)
+rp_x, rp_y = np.asarray(rp_x, dtype=np.float64), np.asarray(rp_y, dtype=np.float64)
 
-        # UTM-K (meters)
-        "centroid_x_utmK": float(cent.x),
-        "centroid_y_utmK": float(cent.y),
-        "rep_x_utmK": float(rp.x),
-        "rep_y_utmK": float(rp.y),
+lon_cent, lat_cent = to_wgs84.transform(cent_x, cent_y)
+lon_rp, lat_rp = to_wgs84.transform(rp_x, rp_y)
 
-        # WGS84 — convenient for maps / sanity checks
-        "centroid_lon_wgs84": float(lon_cent),
-        "centroid_lat_wgs84": float(lat_cent),
-        "rep_lon_wgs84": float(lon_rp),
-        "rep_lat_wgs84": float(lat_rp),
-    })
+df = pd.DataFrame({
+    "BASE_YEAR": np.asarray(base_years, dtype=np.int64),
+    "SIGUNGU_CD": codes,
+    "SIGUNGU_NM": names,
 
-df = pd.DataFrame(rows).sort_values("SIGUNGU_CD").reset_index(drop=True)
+    # UTM-K (meters)
+    "centroid_x_utmK": cent_x,
+    "centroid_y_utmK": cent_y,
+    "rep_x_utmK": rp_x,
+    "rep_y_utmK": rp_y,
+
+    # WGS84 — convenient for maps / sanity checks
+    "centroid_lon_wgs84": lon_cent,
+    "centroid_lat_wgs84": lat_cent,
+    "rep_lon_wgs84": lon_rp,
+    "rep_lat_wgs84": lat_rp,
+})
+
+df = df.sort_values("SIGUNGU_CD").reset_index(drop=True)
 
 # ============================================================
 # 5) Build resid_area-style merge key and apply name "updates"
@@ -140,15 +154,12 @@ if df["SIDO_NM"].isna().any():
 # Split patterns like "포항시남구" -> "포항시/남구"
 pat_city_gu = re.compile(r"^(.*?시)(.*구)$")
 
-def make_resid_area_2010(sido_nm: str, sigungu_nm: str) -> str:
-    m = pat_city_gu.match(sigungu_nm)
-    if m:
-        return f"{sido_nm}/{m.group(1)}/{m.group(2)}"
-    return f"{sido_nm}/{sigungu_nm}"
-
-df["resid_area_2010"] = [
-    make_resid_area_2010(a, b) for a, b in zip(df["SIDO_NM"], df["SIGUNGU_NM"])
-]
+city_gu = df["SIGUNGU_NM"].str.extract(pat_city_gu)  # columns 0 (city), 1 (gu); NaN if no match
+df["resid_area_2010"] = np.where(
+    city_gu[0].notna(),
+    df["SIDO_NM"] + "/" + city_gu[0].fillna("") + "/" + city_gu[1].fillna(""),
+    df["SIDO_NM"] + "/" + df["SIGUNGU_NM"],
+)
 
 # 1-to-1 rename crosswalk to match the main dataset labels
 